@@ -49,6 +49,10 @@ setup(
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,15 +2,31 @@
 
 import sys
 import asyncio
+from typing import Any, Coroutine
+
 from .cli import MCPeekCLI
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run_async(coro: Coroutine[Any, Any, int]) -> int:
+    """Run a coroutine on uvloop when it is installed, otherwise on asyncio's default loop."""
+    if uvloop is not None and hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(coro)
+
 
 def main() -> int:
     """Main entry point for the MCPeek application."""
     try:
         cli = MCPeekCLI()
         args = cli.parse_arguments(sys.argv[1:])
-        return asyncio.run(cli.execute_command(args))
+        return run_async(cli.execute_command(args))
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.", file=sys.stderr)
         return 130
@@ -20,4 +36,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
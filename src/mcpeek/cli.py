@@ -212,40 +212,27 @@ Examples:
             # Load configuration
             config = self.config_manager.load_config(args)
 
-            # Create transport and client
-            transport = await self._create_transport(config)
-            client = MCPClient(transport)
-
-            try:
-                # Execute the requested operation
+            async with MCPClient(await self._create_transport(config)) as client:
+                # Execute the requested operation and format its result
+                formatter = self._create_formatter(config)
                 if config.get('discover'):
                     result = await self._execute_discovery(client, config)
+                    output = formatter.format_discovery_result(result)
                 elif config.get('tool'):
                     result = await self._execute_tool(client, config)
+                    output = formatter.format_tool_result(result)
                 elif config.get('resource'):
                     result = await self._execute_resource(client, config)
+                    output = formatter.format_resource_result(result)
                 elif config.get('prompt'):
                     result = await self._execute_prompt(client, config)
+                    output = formatter.format_tool_result(result)  # Prompts use same format as tools
                 else:
                     raise ValidationError("No valid operation specified")
 
-                # Format and output result
-                formatter = self._create_formatter(config)
-                if config.get('discover'):
-                    output = formatter.format_discovery_result(result)
-                elif config.get('tool'):
-                    output = formatter.format_tool_result(result)
-                elif config.get('resource'):
-                    output = formatter.format_resource_result(result)
-                elif config.get('prompt'):
-                    output = formatter.format_tool_result(result)  # Prompts use same format as tools
-
                 print(output)
                 return 0
 
-            finally:
-                await client.close()
-
         except KeyboardInterrupt:
             if self.logger:
                 self.logger.info("Operation cancelled by user")
@@ -301,16 +288,8 @@ Examples:
     async def _execute_tool(self, client: MCPClient, config: Dict[str, Any]):
         """Execute tool operation."""
         execution_engine = ExecutionEngine(client)
-        tool_name = config['tool']
-
-        # Get input data
-        input_data = None
-        if config.get('stdin'):
-            input_data = await execution_engine.handle_stdin_input()
-        elif config.get('input'):
-            input_data = execution_engine.process_input_data(config['input'])
-
-        return await execution_engine.execute_tool(tool_name, input_data)
+        input_data = await self._load_input_data(execution_engine, config)
+        return await execution_engine.execute_tool(config['tool'], input_data)
 
     async def _execute_resource(self, client: MCPClient, config: Dict[str, Any]):
         """Execute resource read operation."""
@@ -321,16 +300,16 @@ Examples:
     async def _execute_prompt(self, client: MCPClient, config: Dict[str, Any]):
         """Execute prompt get operation."""
         execution_engine = ExecutionEngine(client)
-        prompt_name = config['prompt']
+        input_data = await self._load_input_data(execution_engine, config)
+        return await execution_engine.get_prompt(config['prompt'], input_data)
 
-        # Get input data
-        input_data = None
+    async def _load_input_data(self, execution_engine: ExecutionEngine, config: Dict[str, Any]):
+        """Load operation input from stdin or the --input option, if given."""
         if config.get('stdin'):
-            input_data = await execution_engine.handle_stdin_input()
-        elif config.get('input'):
-            input_data = execution_engine.process_input_data(config['input'])
-
-        return await execution_engine.get_prompt(prompt_name, input_data)
+            return await execution_engine.handle_stdin_input()
+        if config.get('input'):
+            return execution_engine.process_input_data(config['input'])
+        return None
 
     def _create_formatter(self, config: Dict[str, Any]):
         """Create appropriate formatter based on config."""
@@ -1,6 +1,7 @@
 """Discovery engine for MCP endpoint capabilities."""
 
 import asyncio
+import logging
 import re
 from typing import List, Dict, Any
 
@@ -130,8 +131,9 @@ class DiscoveryEngine:
             server_capabilities = self.client.server_capabilities
             tools_capability = server_capabilities.get('tools', {})
             self.logger.debug(f"Cataloged {len(tools)} tools via list_tools()")
-            self.logger.debug(f"Server capabilities show tools: {tools_capability}")
-            self.logger.debug(f"Tool names discovered: {[tool.name for tool in tools]}")
+            self.logger.debug("Server capabilities show tools: %s", tools_capability)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Tool names discovered: %s", [tool.name for tool in tools])
 
             return tools
 
@@ -153,8 +155,9 @@ class DiscoveryEngine:
             server_capabilities = self.client.server_capabilities
             resources_capability = server_capabilities.get('resources', {})
             self.logger.debug(f"Cataloged {len(resources)} resources via list_resources()")
-            self.logger.debug(f"Server capabilities show resources: {resources_capability}")
-            self.logger.debug(f"Resource URIs discovered: {[resource.uri for resource in resources]}")
+            self.logger.debug("Server capabilities show resources: %s", resources_capability)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Resource URIs discovered: %s", [resource.uri for resource in resources])
 
             return resources
 
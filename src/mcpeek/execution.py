@@ -1,5 +1,6 @@
 """Execution engine for MCP operations."""
 
+import asyncio
 import sys
 import json
 from typing import Dict, Any, Optional
@@ -114,8 +115,10 @@ class ExecutionEngine:
         try:
             self.logger.debug("Reading input from stdin")
 
-            # Read all data from stdin
-            stdin_data = sys.stdin.read().strip()
+            # Read all data from stdin in a worker thread so a slow or large
+            # pipe does not stall the event loop (and the transport readers)
+            loop = asyncio.get_running_loop()
+            stdin_data = (await loop.run_in_executor(None, sys.stdin.read)).strip()
 
             if not stdin_data:
                 return {}
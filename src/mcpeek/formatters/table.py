@@ -6,6 +6,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich.syntax import Syntax
+from rich.markup import escape
 from rich import box
 import io
 
@@ -13,6 +14,11 @@ from .base import BaseFormatter, DiscoveryResult
 from ..utils.helpers import extract_error_details, safe_json_dumps
 
 
+def _escape_cell(value: Any) -> str:
+    """Escape a server-supplied table cell; missing values render empty."""
+    return escape(str(value)) if value is not None else ""
+
+
 class TableFormatter(BaseFormatter):
     """Human-readable table formatting."""
 
@@ -79,7 +85,7 @@ class TableFormatter(BaseFormatter):
                 table = self._create_list_table(tool_result, "Tool Result")
                 console.print(table)
             else:
-                console.print(Panel(str(tool_result), title="🔧 Tool Result", border_style="green"))
+                console.print(Panel(escape(str(tool_result)), title="🔧 Tool Result", border_style="green"))
         else:
             # Show full result
             table = self._create_dict_table(result, "Tool Execution")
@@ -99,7 +105,7 @@ class TableFormatter(BaseFormatter):
                 for i, content in enumerate(contents):
                     title = f"📄 Resource Content {i+1}"
                     if "uri" in content:
-                        title += f" ({content['uri']})"
+                        title += f" ({escape(str(content['uri']))})"
 
                     content_panel = self._create_content_panel(content)
                     console.print(Panel(content_panel, title=title, border_style="cyan"))
@@ -124,10 +130,10 @@ class TableFormatter(BaseFormatter):
         error_details = extract_error_details(error)
 
         error_text = f"[bold red]{error_details['type']}[/bold red]\n"
-        error_text += f"[red]{error_details['message']}[/red]"
+        error_text += f"[red]{escape(error_details['message'])}[/red]"
 
         if error_details.get('details'):
-            error_text += f"\n\n[dim]Details:[/dim]\n{safe_json_dumps(error_details['details'], pretty=True)}"
+            error_text += f"\n\n[dim]Details:[/dim]\n{escape(safe_json_dumps(error_details['details'], pretty=True))}"
 
         console.print(Panel(error_text, title="❌ Error", border_style="red"))
         return output.getvalue()
@@ -140,10 +146,11 @@ class TableFormatter(BaseFormatter):
         if version_info and version_info.get("status") != "not_detected":
             info_text += "[bold cyan]🔧 MCP Version Information[/bold cyan]\n"
             
-            protocol_version = version_info.get("protocol_version", "unknown")
-            spec_version = version_info.get("specification_version", "unknown")
-            compatibility = version_info.get("compatibility", "unknown")
-            confidence = version_info.get("confidence", "0%")
+            protocol_version = escape(str(version_info.get("protocol_version", "unknown")))
+            spec_version = escape(str(version_info.get("specification_version", "unknown")))
+            compatibility = escape(str(version_info.get("compatibility", "unknown")))
+            confidence = escape(str(version_info.get("confidence", "0%")))
+            detection_method = escape(str(version_info.get("detection_method", "unknown")))
             
             # Color-code compatibility status with emojis
             if compatibility == "fully_compatible":
@@ -163,7 +170,7 @@ class TableFormatter(BaseFormatter):
             info_text += f"  📜 Specification Version: [bold bright_magenta]{spec_version}[/bold bright_magenta]\n"
             info_text += f"  {compat_emoji} Compatibility: [{compat_color}]{compatibility}[/{compat_color}]\n"
             info_text += f"  🎯 Detection Confidence: [bold bright_green]{confidence}[/bold bright_green]\n"
-            info_text += f"  🔍 Detection Method: [dim]{version_info.get('detection_method', 'unknown')}[/dim]\n"
+            info_text += f"  🔍 Detection Method: [dim]{detection_method}[/dim]\n"
             
             # Show supported features count
             feature_count = version_info.get("supported_features", 0)
@@ -176,7 +183,7 @@ class TableFormatter(BaseFormatter):
             for key, value in server_info.items():
                 # Skip version_info as we already displayed it above
                 if key != "version_info":
-                    info_text += f"  📍 {key}: [bright_yellow]{value}[/bright_yellow]\n"
+                    info_text += f"  📍 {escape(str(key))}: [bright_yellow]{escape(str(value))}[/bright_yellow]\n"
             info_text += "\n"
 
         # Capabilities Summary
@@ -192,9 +199,9 @@ class TableFormatter(BaseFormatter):
             info_text += f"  📊 Total Capabilities: [bold bright_cyan]{len(capabilities)}[/bold bright_cyan]\n"
             for key, value in capabilities.items():
                 if isinstance(value, dict) and value:
-                    info_text += f"  🔧 {key}: [bold green]{len(value)} items[/bold green]\n"
+                    info_text += f"  🔧 {escape(str(key))}: [bold green]{len(value)} items[/bold green]\n"
                 elif value:
-                    info_text += f"  ✅ {key}: [bold green]enabled[/bold green]\n"
+                    info_text += f"  ✅ {escape(str(key))}: [bold green]enabled[/bold green]\n"
 
         return Panel(info_text.strip(), title="🖥️  Server Info", border_style="blue")
 
@@ -230,7 +237,7 @@ class TableFormatter(BaseFormatter):
                 schema = safe_json_dumps(tool.schema, pretty=False) if tool.schema else "None"
                 row.append(self.truncate_text(schema, 60))
 
-            table.add_row(*row)
+            table.add_row(*[_escape_cell(cell) for cell in row])
 
         return table
 
@@ -265,7 +272,7 @@ class TableFormatter(BaseFormatter):
                 metadata = safe_json_dumps(resource.metadata, pretty=False) if resource.metadata else "None"
                 row.append(self.truncate_text(metadata, 60))
 
-            table.add_row(*row)
+            table.add_row(*[_escape_cell(cell) for cell in row])
 
         return table
 
@@ -299,7 +306,7 @@ class TableFormatter(BaseFormatter):
                 schema = safe_json_dumps(prompt.schema, pretty=False) if prompt.schema else "None"
                 row.append(self.truncate_text(schema, 60))
 
-            table.add_row(*row)
+            table.add_row(*[_escape_cell(cell) for cell in row])
 
         return table
 
@@ -315,7 +322,7 @@ class TableFormatter(BaseFormatter):
             else:
                 value_str = str(value)
 
-            table.add_row(key, self.truncate_text(value_str, 80))
+            table.add_row(escape(str(key)), escape(self.truncate_text(value_str, 80)))
 
         return table
 
@@ -331,7 +338,7 @@ class TableFormatter(BaseFormatter):
             else:
                 item_str = str(item)
 
-            table.add_row(str(i), self.truncate_text(item_str, 80))
+            table.add_row(str(i), escape(self.truncate_text(item_str, 80)))
 
         return table
 
@@ -343,16 +350,16 @@ class TableFormatter(BaseFormatter):
         content_text = ""
 
         if "mimeType" in content:
-            content_text += f"[bold]MIME Type:[/bold] {content['mimeType']}\n"
+            content_text += f"[bold]MIME Type:[/bold] {escape(str(content['mimeType']))}\n"
 
         if "uri" in content:
-            content_text += f"[bold]URI:[/bold] {content['uri']}\n"
+            content_text += f"[bold]URI:[/bold] {escape(str(content['uri']))}\n"
 
         if "text" in content:
             text_content = content["text"]
             if len(text_content) > 500:
                 text_content = text_content[:500] + "..."
-            content_text += f"\n[bold]Content:[/bold]\n{text_content}"
+            content_text += f"\n[bold]Content:[/bold]\n{escape(text_content)}"
         elif "blob" in content:
             content_text += f"\n[bold]Binary Content:[/bold] {len(content['blob'])} bytes"
 
@@ -364,7 +371,7 @@ class TableFormatter(BaseFormatter):
             return "[dim]No tool exploration performed[/dim]"
         
         if "error" in exploration_results:
-            return f"[red]Tool exploration failed: {exploration_results['error']}[/red]"
+            return f"[red]Tool exploration failed: {escape(str(exploration_results['error']))}[/red]"
         
         panel_text = ""
         successful_tools = []
@@ -392,7 +399,7 @@ class TableFormatter(BaseFormatter):
         if successful_tools:
             panel_text += "[bold green]✓ Successful Explorations[/bold green]\n"
             for tool_name, result in successful_tools:
-                panel_text += f"  [green]•[/green] [bold]{tool_name}[/bold]\n"
+                panel_text += f"  [green]•[/green] [bold]{escape(tool_name)}[/bold]\n"
                 
                 # Show a preview of the result if it's not too complex
                 tool_result = result.get("result", {})
@@ -406,7 +413,7 @@ class TableFormatter(BaseFormatter):
                             preview = str(content)[:100]
                             if len(str(content)) > 100:
                                 preview += "..."
-                            panel_text += f"    Result: {preview}\n"
+                            panel_text += f"    Result: {escape(preview)}\n"
                     else:
                         # Show a few key-value pairs
                         preview_items = list(tool_result.items())[:2]
@@ -415,14 +422,14 @@ class TableFormatter(BaseFormatter):
                                 value_str = str(value)[:50]
                                 if len(str(value)) > 50:
                                     value_str += "..."
-                                panel_text += f"    {key}: {value_str}\n"
+                                panel_text += f"    {escape(str(key))}: {escape(value_str)}\n"
                 elif isinstance(tool_result, list):
                     panel_text += f"    Result: List with {len(tool_result)} items\n"
                 else:
                     preview = str(tool_result)[:100]
                     if len(str(tool_result)) > 100:
                         preview += "..."
-                    panel_text += f"    Result: {preview}\n"
+                    panel_text += f"    Result: {escape(preview)}\n"
                 
                 panel_text += "\n"
         
@@ -430,14 +437,14 @@ class TableFormatter(BaseFormatter):
         if failed_tools:
             panel_text += "[bold red]✗ Failed Explorations[/bold red]\n"
             for tool_name, result in failed_tools:
-                panel_text += f"  [red]•[/red] [bold]{tool_name}[/bold]\n"
+                panel_text += f"  [red]•[/red] [bold]{escape(tool_name)}[/bold]\n"
                 error_msg = result.get("error", "Unknown error")
                 status = result.get("status", "error")
                 
                 if status == "failed_empty_params":
-                    panel_text += f"    [yellow]Requires parameters[/yellow]: {error_msg[:100]}\n"
+                    panel_text += f"    [yellow]Requires parameters[/yellow]: {escape(error_msg[:100])}\n"
                 else:
-                    panel_text += f"    [red]Error[/red]: {error_msg[:100]}\n"
+                    panel_text += f"    [red]Error[/red]: {escape(error_msg[:100])}\n"
                 panel_text += "\n"
         
         return panel_text.strip()
\ No newline at end of file
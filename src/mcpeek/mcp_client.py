@@ -97,96 +97,47 @@ class MCPClient:
 
     async def list_tools(self) -> List[Dict[str, Any]]:
         """Get list of available tools from server."""
-        if not self._initialized:
-            await self.initialize_connection()
-
-        try:
-            self.logger.debug("Requesting tools list")
-            response = await self.transport.send_request("tools/list")
-
-            # Handle empty or malformed responses gracefully
-            if not response or not isinstance(response, dict):
-                self.logger.warning("Received empty or invalid response for tools/list")
-                return []
-
-            if "result" not in response:
-                self.logger.warning("Tools list response missing result field")
-                return []
-
-            result = response["result"]
-            if not isinstance(result, dict):
-                self.logger.warning("Tools list result is not a dictionary")
-                return []
-
-            tools = result.get("tools", [])
-            self.logger.info(f"Retrieved {len(tools)} tools")
-            return tools
-
-        except Exception as e:
-            self.logger.error(f"Failed to list tools: {e}")
-            raise ProtocolError(f"Failed to list tools: {e}")
+        return await self._list_items("tools/list", "tools")
 
     async def list_resources(self) -> List[Dict[str, Any]]:
         """Get list of available resources from server."""
-        if not self._initialized:
-            await self.initialize_connection()
-
-        try:
-            self.logger.debug("Requesting resources list")
-            response = await self.transport.send_request("resources/list")
-
-            # Handle empty or malformed responses gracefully
-            if not response or not isinstance(response, dict):
-                self.logger.warning("Received empty or invalid response for resources/list")
-                return []
-
-            if "result" not in response:
-                self.logger.warning("Resources list response missing result field")
-                return []
-
-            result = response["result"]
-            if not isinstance(result, dict):
-                self.logger.warning("Resources list result is not a dictionary")
-                return []
-
-            resources = result.get("resources", [])
-            self.logger.info(f"Retrieved {len(resources)} resources")
-            return resources
-
-        except Exception as e:
-            self.logger.error(f"Failed to list resources: {e}")
-            raise ProtocolError(f"Failed to list resources: {e}")
+        return await self._list_items("resources/list", "resources")
 
     async def list_prompts(self) -> List[Dict[str, Any]]:
         """Get list of available prompts from server."""
+        return await self._list_items("prompts/list", "prompts")
+
+    async def _list_items(self, method: str, key: str) -> List[Dict[str, Any]]:
+        """Send a */list request and return the items under ``key`` in its result."""
         if not self._initialized:
             await self.initialize_connection()
 
+        label = key.capitalize()
         try:
-            self.logger.debug("Requesting prompts list")
-            response = await self.transport.send_request("prompts/list")
+            self.logger.debug(f"Requesting {key} list")
+            response = await self.transport.send_request(method)
 
             # Handle empty or malformed responses gracefully
             if not response or not isinstance(response, dict):
-                self.logger.warning("Received empty or invalid response for prompts/list")
+                self.logger.warning(f"Received empty or invalid response for {method}")
                 return []
 
             if "result" not in response:
-                self.logger.warning("Prompts list response missing result field")
+                self.logger.warning(f"{label} list response missing result field")
                 return []
 
             result = response["result"]
             if not isinstance(result, dict):
-                self.logger.warning("Prompts list result is not a dictionary")
+                self.logger.warning(f"{label} list result is not a dictionary")
                 return []
 
-            prompts = result.get("prompts", [])
-            self.logger.info(f"Retrieved {len(prompts)} prompts")
-            return prompts
+            items = result.get(key, [])
+            self.logger.info(f"Retrieved {len(items)} {key}")
+            return items
 
         except Exception as e:
-            self.logger.error(f"Failed to list prompts: {e}")
-            raise ProtocolError(f"Failed to list prompts: {e}")
+            self.logger.error(f"Failed to list {key}: {e}")
+            raise ProtocolError(f"Failed to list {key}: {e}")
 
     async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a specific tool with arguments."""
@@ -307,7 +258,12 @@ class MCPClient:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        await self.initialize_connection()
+        try:
+            await self.initialize_connection()
+        except BaseException:
+            # __aexit__ is not called when entry fails; release the transport
+            await self.close()
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
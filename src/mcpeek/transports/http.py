@@ -14,13 +14,20 @@ class HTTPTransport(BaseTransport):
     """HTTP/HTTPS transport implementation."""
 
     def __init__(self, url: str, auth_headers: Optional[Dict[str, str]] = None,
-                 timeout: float = 30.0):
-        """Initialize HTTP transport with URL and auth."""
+                 timeout: float = 30.0, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize HTTP transport with URL and auth.
+
+        An existing ``session`` may be passed in to share its connection pool
+        across transports; it is left open when this transport is closed.
+        """
         super().__init__()
         self.url = url
         self.auth_headers = auth_headers or {}
         self.timeout = timeout
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+        self._request_headers: Dict[str, str] = {}
         self._response_queue: asyncio.Queue = asyncio.Queue()
 
     async def connect(self) -> None:
@@ -29,38 +36,25 @@ class HTTPTransport(BaseTransport):
             return
 
         try:
-            # Create session with timeout configuration
-            timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(
-                timeout=timeout_config,
-                headers=self.auth_headers
-            )
+            # Create session with timeout configuration. No probe request is
+            # sent here: the MCP initialize handshake is the first round trip
+            # and surfaces connection failures as ConnectionError.
+            if self._owns_session:
+                self.session = aiohttp.ClientSession(timeout=self._client_timeout)
 
-            # Test connection with a simple request
-            await self._test_connection()
+            # Auth travels per request so a shared session can serve many
+            # endpoints; built here so earlier auth_headers changes apply
+            self._request_headers = {**self.auth_headers, "Content-Type": "application/json"}
 
             self._connected = True
             self.logger.info(f"Connected to HTTP endpoint: {self.url}")
 
         except Exception as e:
-            if self.session:
+            if self.session and self._owns_session:
                 await self.session.close()
                 self.session = None
             raise ConnectionError(f"Failed to connect to {self.url}: {e}")
 
-    async def _test_connection(self) -> None:
-        """Test the HTTP connection."""
-        if not self.session:
-            raise ConnectionError("No session available")
-
-        try:
-            # Try to make a simple request to test connectivity
-            async with self.session.post(self.url, json={"test": "connection"}) as response:
-                # We don't care about the response content, just that we can connect
-                pass
-        except aiohttp.ClientError as e:
-            raise ConnectionError(f"Connection test failed: {e}")
-
     async def send_message(self, message: Dict[str, Any]) -> None:
         """Send HTTP POST request with JSON-RPC payload."""
         if not self.session or not self._connected:
@@ -73,13 +67,14 @@ class HTTPTransport(BaseTransport):
             # Convert to JSON
             json_data = safe_json_dumps(message)
 
-            self.logger.debug(f"Sending HTTP message: {json_data}")
+            self.logger.debug("Sending HTTP message: %s", json_data)
 
             # Send POST request
             async with self.session.post(
                 self.url,
                 data=json_data,
-                headers={"Content-Type": "application/json"}
+                headers=self._request_headers,
+                timeout=self._client_timeout
             ) as response:
 
                 if response.status >= 400:
@@ -87,9 +82,9 @@ class HTTPTransport(BaseTransport):
                     raise ProtocolError(f"HTTP {response.status}: {error_text}")
 
                 # For HTTP transport, we expect immediate response
-                response_text = await response.text()
-                if response_text:
-                    response_data = safe_json_loads(response_text)
+                response_body = await response.read()
+                if response_body:
+                    response_data = safe_json_loads(response_body)
                     await self._response_queue.put(response_data)
 
         except aiohttp.ClientError as e:
@@ -109,7 +104,7 @@ class HTTPTransport(BaseTransport):
                 timeout=self.timeout
             )
 
-            self.logger.debug(f"Received HTTP response: {response}")
+            self.logger.debug("Received HTTP response: %s", response)
 
             # Validate response structure
             validate_json_rpc_message(response)
@@ -127,9 +122,9 @@ class HTTPTransport(BaseTransport):
         self._connected = False
         self._closed = True
 
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
-            self.session = None
+        self.session = None
 
         self.logger.info("HTTP transport closed")
 
@@ -164,18 +159,20 @@ class HTTPTransport(BaseTransport):
             async with self.session.post(
                 self.url,
                 data=json_data,
-                headers={"Content-Type": "application/json"}
+                headers=self._request_headers,
+                timeout=self._client_timeout
             ) as response:
 
                 if response.status >= 400:
                     error_text = await response.text()
                     raise ProtocolError(f"HTTP {response.status}: {error_text}")
 
-                response_text = await response.text()
-                if not response_text:
+                # Parse the raw body directly rather than decoding it to str first
+                response_body = await response.read()
+                if not response_body:
                     raise ProtocolError("Empty response from server")
 
-                response_data = safe_json_loads(response_text)
+                response_data = safe_json_loads(response_body)
 
                 # Validate response
                 validate_json_rpc_message(response_data)
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import logging
 import shlex
 from typing import Dict, Any, Optional, List
 import subprocess
@@ -11,6 +12,16 @@ from ..utils.exceptions import ConnectionError, TimeoutError, ProtocolError
 from ..utils.helpers import validate_json_rpc_message, safe_json_loads, safe_json_dumps, sanitize_file_path
 
 
+# Maximum size of a single newline-delimited message read from the server.
+# asyncio's 64 KiB default is easily exceeded by a large tools/list reply.
+STDIO_LINE_LIMIT = 16 * 1024 * 1024
+
+# Unsolicited messages (notifications, late replies) kept for receive_message.
+# Nothing reads them during normal request/response use, so older ones are
+# dropped rather than accumulating for the life of the process.
+STDIO_UNSOLICITED_LIMIT = 100
+
+
 class STDIOTransport(BaseTransport):
     """STDIO transport for local processes."""
 
@@ -21,7 +32,10 @@ class STDIOTransport(BaseTransport):
         self.timeout = timeout
         self.process: Optional[asyncio.subprocess.Process] = None
         self._read_task: Optional[asyncio.Task] = None
-        self._response_queue: asyncio.Queue = asyncio.Queue()
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._response_queue: asyncio.Queue = asyncio.Queue(maxsize=STDIO_UNSOLICITED_LIMIT)
+        # Futures for in-flight requests, keyed by JSON-RPC id
+        self._pending: Dict[Any, asyncio.Future] = {}
 
     @classmethod
     def from_command_string(cls, command_str: str, timeout: float = 30.0) -> 'STDIOTransport':
@@ -49,11 +63,13 @@ class STDIOTransport(BaseTransport):
                 *self.command,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=STDIO_LINE_LIMIT
             )
 
-            # Start background task to read responses
+            # Start background tasks to read responses and drain stderr
             self._read_task = asyncio.create_task(self._read_responses())
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
 
             self._connected = True
             self.logger.info(f"Started STDIO process: {' '.join(self.command)}")
@@ -79,9 +95,9 @@ class STDIOTransport(BaseTransport):
                     # Decode and parse JSON
                     line_str = line.decode('utf-8').strip()
                     if line_str:
-                        self.logger.debug(f"Received STDIO line: {line_str}")
+                        self.logger.debug("Received STDIO line: %s", line_str)
                         response_data = safe_json_loads(line_str)
-                        await self._response_queue.put(response_data)
+                        self._dispatch_response(response_data)
 
                 except Exception as e:
                     self.logger.warning(f"Failed to parse STDIO response: {e}")
@@ -89,6 +105,55 @@ class STDIOTransport(BaseTransport):
         except Exception as e:
             self.logger.error(f"Error reading STDIO responses: {e}")
 
+        finally:
+            # Nothing more will arrive; fail requests still waiting for a reply
+            self._fail_pending(ConnectionError("STDIO process closed its output"))
+
+    def _dispatch_response(self, message: Any) -> None:
+        """Hand a response to the request awaiting its id, or queue it."""
+        if isinstance(message, dict) and "method" not in message:
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None:
+                if not future.done():
+                    future.set_result(message)
+                return
+
+        # Notifications, server requests and unmatched responses
+        self.logger.debug("Unsolicited STDIO message: %s", message)
+        if self._response_queue.full():
+            self._response_queue.get_nowait()
+        self._response_queue.put_nowait(message)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight request with ``error``."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _drain_stderr(self) -> None:
+        """Background task to consume the server's stderr.
+
+        Without a reader the pipe fills up once the server has logged a few
+        hundred KiB, and its next write blocks the whole process.
+        """
+        if not self.process or not self.process.stderr:
+            return
+
+        try:
+            while True:
+                # Read in chunks rather than lines so overlong lines cannot
+                # stop the drain
+                chunk = await self.process.stderr.read(65536)
+                if not chunk:
+                    break
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for line in chunk.decode('utf-8', errors='replace').splitlines():
+                        self.logger.debug("STDIO stderr: %s", line)
+
+        except Exception as e:
+            self.logger.debug(f"Stopped reading STDIO stderr: {e}")
+
     async def send_message(self, message: Dict[str, Any]) -> None:
         """Send JSON-RPC message via stdin."""
         if not self.process or not self.process.stdin or not self._connected:
@@ -98,13 +163,13 @@ class STDIOTransport(BaseTransport):
             # Validate message structure
             validate_json_rpc_message(message)
 
-            # Convert to JSON and add newline
-            json_data = safe_json_dumps(message) + '\n'
+            # Convert to JSON
+            json_data = safe_json_dumps(message)
 
-            self.logger.debug(f"Sending STDIO message: {json_data.strip()}")
+            self.logger.debug("Sending STDIO message: %s", json_data)
 
-            # Write to stdin
-            self.process.stdin.write(json_data.encode('utf-8'))
+            # Write newline-delimited message to stdin
+            self.process.stdin.write((json_data + '\n').encode('utf-8'))
             await self.process.stdin.drain()
 
         except Exception as e:
@@ -122,10 +187,11 @@ class STDIOTransport(BaseTransport):
                 timeout=self.timeout
             )
 
-            self.logger.debug(f"Received STDIO response: {response}")
+            self.logger.debug("Received STDIO response: %s", response)
 
             # Log the raw response for debugging
-            self.logger.debug(f"Raw response structure: {list(response.keys()) if isinstance(response, dict) else type(response)}")
+            self.logger.debug("Raw response structure: %s",
+                              list(response.keys()) if isinstance(response, dict) else type(response))
 
             # Validate response structure - but be more lenient for incoming responses
             try:
@@ -154,13 +220,14 @@ class STDIOTransport(BaseTransport):
 
     async def _cleanup(self) -> None:
         """Clean up process and tasks."""
-        # Cancel read task
-        if self._read_task and not self._read_task.done():
-            self._read_task.cancel()
-            try:
-                await self._read_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel reader tasks
+        for task in (self._read_task, self._stderr_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         # Terminate process
         if self.process:
@@ -205,28 +272,25 @@ class STDIOTransport(BaseTransport):
         if params is not None:
             message["params"] = params
 
-        # Send message
-        await self.send_message(message)
-
-        # Wait for response with matching ID
-        while True:
-            response = await self.receive_message()
-
-            # Skip empty or invalid responses
-            if not response or not isinstance(response, dict):
-                self.logger.warning(f"Skipping invalid response: {response}")
-                continue
-
-            # Check if this response matches our request ID
-            if response.get("id") == req_id:
-                # Validate response
-                if "error" in response:
-                    error = response["error"]
-                    raise ProtocolError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
-                return response
-            else:
-                # This response is for a different request, log and continue waiting
-                self.logger.debug(f"Received response for different request ID. Expected: {req_id}, Got: {response.get('id')}")
+        # Register before sending so the reader can route the reply to us.
+        # Concurrent requests each wait on their own future, so replies may
+        # arrive in any order without being dropped.
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+
+        try:
+            await self.send_message(message)
+            response = await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No response received within {self.timeout}s")
+        finally:
+            self._pending.pop(req_id, None)
+
+        # Validate response
+        if "error" in response:
+            error = response["error"]
+            raise ProtocolError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
+        return response
 
     def __del__(self):
         """Cleanup on deletion."""
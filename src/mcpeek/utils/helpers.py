@@ -1,5 +1,6 @@
 """Helper utilities for MCPeek."""
 
+import itertools
 import json
 import os
 import re
@@ -9,6 +10,15 @@ from urllib.parse import urlparse
 
 from .exceptions import ValidationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 19+ digits can exceed int64/uint64, which orjson would decode as a float
+_WIDE_INT_RE = re.compile(r'[0-9]{19,}')
+_WIDE_INT_RE_BYTES = re.compile(rb'[0-9]{19,}')
+
 
 def parse_endpoint_url(endpoint: str) -> Dict[str, str]:
     """Parse endpoint URL and determine transport type."""
@@ -81,20 +91,48 @@ def format_duration(seconds: float) -> str:
         return f"{minutes}m {remaining_seconds:.1f}s"
 
 
-def safe_json_loads(data: str) -> Dict[str, Any]:
+def _has_wide_int(data: Union[str, bytes]) -> bool:
+    """Check for digit runs that may be integers too wide for orjson."""
+    if isinstance(data, str):
+        return _WIDE_INT_RE.search(data) is not None
+    return _WIDE_INT_RE_BYTES.search(data) is not None
+
+
+def safe_json_loads(data: Union[str, bytes]) -> Dict[str, Any]:
     """Safely load JSON data with error handling."""
+    # orjson silently parses integers wider than 64 bits as floats, so any
+    # payload that may contain one goes straight to the stdlib
+    if orjson is not None and not _has_wide_int(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects input the stdlib accepts (NaN, out-of-range
+            # floats); let json.loads decide and report genuine errors
+            pass
+
     try:
         return json.loads(data)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise ValidationError(f"Invalid JSON data: {e}")
 
 
 def safe_json_dumps(data: Any, pretty: bool = False) -> str:
     """Safely dump data to JSON with error handling."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option).decode('utf-8')
+        except TypeError:
+            # Fall back to the stdlib for values orjson rejects (e.g. big ints)
+            pass
+
     try:
         if pretty:
             return json.dumps(data, indent=2, ensure_ascii=False)
-        return json.dumps(data, ensure_ascii=False)
+        # Compact separators match orjson's output
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
     except (TypeError, ValueError) as e:
         raise ValidationError(f"Cannot serialize to JSON: {e}")
 
@@ -117,10 +155,15 @@ def extract_error_details(error: Exception) -> Dict[str, Any]:
     }
 
 
+_REQUEST_ID_PREFIX = f"mcpeek-{int(time.time() * 1000)}"
+_request_counter = itertools.count(1)
+
+
 def create_request_id() -> str:
     """Create a unique request ID for JSON-RPC messages."""
-    import random
-    return f"mcpeek-{int(time.time() * 1000)}-{random.randint(1000, 9999)}"
+    # A per-process counter is cheaper than a clock read plus RNG call and,
+    # unlike a random suffix, can never collide between in-flight requests.
+    return f"{_REQUEST_ID_PREFIX}-{next(_request_counter)}"
 
 
 def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON helpers.
+Decoding must match the stdlib whether or not orjson is installed.
+"""
+
+import math
+import sys
+import os
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from mcpeek.utils.helpers import safe_json_loads, safe_json_dumps
+from mcpeek.utils.exceptions import ValidationError
+
+
+def test_non_finite_numbers_fall_back_to_stdlib():
+    """Test that NaN and out-of-range floats parse as the stdlib does."""
+    print("Testing NaN and 1e400 decoding...")
+    data = safe_json_loads('{"a": NaN, "b": 1e400}')
+    assert math.isnan(data["a"])
+    assert data["b"] == float("inf")
+    print("✓ Non-finite numbers decoded")
+
+
+def test_bytes_input():
+    """Test that bytes input decodes like str input."""
+    print("Testing bytes input...")
+    assert safe_json_loads(b'{"a": [1, "\xc3\xa9"]}') == {"a": [1, "é"]}
+    print("✓ Bytes input decoded")
+
+
+def test_invalid_input_raises_validation_error():
+    """Test that bad JSON and invalid UTF-8 raise ValidationError."""
+    print("Testing invalid input...")
+    for bad in ('{bad', b'\xff{}', b'{"a": 12345678901234567890\xff}'):
+        try:
+            safe_json_loads(bad)
+        except ValidationError:
+            continue
+        raise AssertionError(f"{bad!r} did not raise ValidationError")
+    print("✓ Invalid input raises ValidationError")
+
+
+def test_big_int_round_trip():
+    """Test that integers wider than 64 bits keep full precision."""
+    print("Testing big integer round-trip...")
+    big = 123456789012345678901234567890
+    for raw in ('{"big": %d}' % big, b'{"big": %d}' % big, '{"big": -%d}' % big):
+        data = safe_json_loads(raw)
+        assert isinstance(data["big"], int) and abs(data["big"]) == big
+        assert safe_json_loads(safe_json_dumps(data)) == data
+    assert safe_json_dumps({"big": big}) == '{"big":%d}' % big
+    print("✓ Big integers round-trip exactly")
+
+
+def test_compact_dumps_separators():
+    """Test that compact output is identical on both encoder paths."""
+    print("Testing compact dumps separators...")
+    assert safe_json_dumps({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+    assert safe_json_dumps({"a": 2 ** 70}) == '{"a":%d}' % 2 ** 70
+    print("✓ Compact separators consistent")
+
+
+def main():
+    """Run all tests."""
+    print("Running JSON Helper Tests")
+    print("=" * 50)
+
+    tests = [
+        test_non_finite_numbers_fall_back_to_stdlib,
+        test_bytes_input,
+        test_invalid_input_raises_validation_error,
+        test_big_int_round_trip,
+        test_compact_dumps_separators,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"✗ {test.__name__} FAILED with exception: {e!r}\n")
+
+    print("=" * 50)
+    if failed == 0:
+        print("🎉 All tests passed!")
+        return 0
+    print("❌ Some tests failed")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
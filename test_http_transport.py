@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the HTTP transport.
+Runs a local aiohttp server and checks behaviour with an injected session.
+"""
+
+import asyncio
+import sys
+import os
+
+import aiohttp
+from aiohttp import web
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from mcpeek.transports.http import HTTPTransport
+
+
+async def _start_server(seen_headers):
+    """Start a JSON-RPC echo server on a free port and return its runner and URL."""
+    async def handle(request):
+        seen_headers.append(dict(request.headers))
+        message = await request.json()
+        return web.json_response({"jsonrpc": "2.0", "id": message["id"], "result": {}})
+
+    app = web.Application()
+    app.router.add_post("/mcp", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/mcp"
+
+
+def test_injected_session_left_open_and_auth_sent_per_request():
+    """Test that an injected session is not closed and carries no auth defaults."""
+    async def run():
+        seen_headers = []
+        runner, url = await _start_server(seen_headers)
+        try:
+            async with aiohttp.ClientSession() as session:
+                transport = HTTPTransport(url, session=session)
+                # Changes made before connect() must still take effect
+                transport.auth_headers["Authorization"] = "Bearer secret"
+                await transport.connect()
+                await transport.send_request("ping")
+                await transport.close()
+
+                assert session.closed is False
+                assert "Authorization" not in session.headers
+                assert seen_headers[0].get("Authorization") == "Bearer secret"
+        finally:
+            await runner.cleanup()
+
+    print("Testing HTTP transport with an injected session...")
+    asyncio.run(run())
+    print("✓ Injected session left open, auth sent per request")
+
+
+def main():
+    """Run all tests."""
+    print("Running HTTP Transport Tests")
+    print("=" * 50)
+
+    try:
+        test_injected_session_left_open_and_auth_sent_per_request()
+    except Exception as e:
+        print(f"✗ test_injected_session_left_open_and_auth_sent_per_request FAILED with exception: {e!r}")
+        return 1
+
+    print("🎉 All tests passed!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the STDIO transport.
+Runs a small scripted server that answers concurrent requests out of order.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from mcpeek.transports.stdio import STDIOTransport, STDIO_UNSOLICITED_LIMIT
+
+
+# Buffers three requests, then replies in reverse order. Every reply is
+# preceded by more notifications than the unsolicited queue holds.
+OUT_OF_ORDER_SERVER = f"""
+import json, sys
+held = []
+for line in sys.stdin:
+    msg = json.loads(line)
+    held.append({{"jsonrpc": "2.0", "id": msg["id"], "result": {{"method": msg["method"]}}}})
+    if len(held) == 3:
+        for reply in reversed(held):
+            for i in range({STDIO_UNSOLICITED_LIMIT} + 5):
+                note = {{"jsonrpc": "2.0", "method": "notifications/message", "params": {{"n": i}}}}
+                sys.stdout.write(json.dumps(note) + "\\n")
+            sys.stdout.write(json.dumps(reply) + "\\n")
+        sys.stdout.flush()
+        held = []
+"""
+
+
+def test_concurrent_requests_answered_out_of_order():
+    """Test that each concurrent request receives its own response."""
+    async def run():
+        transport = STDIOTransport([sys.executable, "-c", OUT_OF_ORDER_SERVER], timeout=10)
+        await transport.connect()
+        try:
+            methods = ["tools/list", "resources/list", "prompts/list"]
+            responses = await asyncio.gather(
+                *(transport.send_request(method) for method in methods)
+            )
+            assert [r["result"]["method"] for r in responses] == methods
+            assert transport._response_queue.qsize() <= STDIO_UNSOLICITED_LIMIT
+            assert not transport._pending
+        finally:
+            await transport.close()
+
+    print("Testing concurrent STDIO requests with out-of-order replies...")
+    asyncio.run(run())
+    print("✓ Responses routed to their requests by id")
+
+
+def main():
+    """Run all tests."""
+    print("Running STDIO Transport Tests")
+    print("=" * 50)
+
+    try:
+        test_concurrent_requests_answered_out_of_order()
+    except Exception as e:
+        print(f"✗ test_concurrent_requests_answered_out_of_order FAILED with exception: {e!r}")
+        return 1
+
+    print("🎉 All tests passed!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the table formatter.
+Server-supplied strings must be rendered literally, never parsed as rich markup.
+"""
+
+import sys
+import os
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from mcpeek.formatters.base import DiscoveryResult, ToolInfo, ResourceInfo, PromptInfo
+from mcpeek.formatters.table import TableFormatter
+
+
+def test_discovery_result_with_markup_in_server_strings():
+    """Test that markup-like server values do not break rendering."""
+    result = DiscoveryResult(
+        server_info={"name": "fake [/x]", "[/key]": "v"},
+        tools=[ToolInfo(name="list_[/x]", description="Lists [/x] things")],
+        resources=[],
+        prompts=[],
+        capabilities={"[/cap]": {"listChanged": True}, "[/flag]": True},
+        verbosity_level=1,
+        version_info={
+            "status": "detected",
+            "protocol_version": "[/x]",
+            "specification_version": "[/x]",
+            "compatibility": "[/x]",
+            "confidence": "[/x]",
+            "detection_method": "server_response ([/x])",
+        },
+    )
+
+    print("Testing discovery rendering with markup in server strings...")
+    output = TableFormatter(use_colors=False).format_discovery_result(result)
+
+    for expected in ("fake [/x]", "[/key]", "[/cap]", "[/flag]", "server_response ([/x])"):
+        assert expected in output, f"{expected!r} missing from rendered output"
+    print("✓ Markup-like server strings rendered literally")
+
+
+def test_discovery_result_with_missing_names():
+    """Test that tools, resources and prompts without a name still render."""
+    result = DiscoveryResult(
+        server_info={},
+        tools=[ToolInfo(name=None, description="Nameless tool")],
+        resources=[ResourceInfo(uri=None, name=None)],
+        prompts=[PromptInfo(name=None, description="Nameless prompt")],
+        capabilities={},
+        verbosity_level=3,
+    )
+
+    print("Testing discovery rendering with None names...")
+    output = TableFormatter(use_colors=False).format_discovery_result(result)
+
+    assert "Nameless tool" in output
+    assert "Nameless prompt" in output
+    print("✓ None names rendered as empty cells")
+
+
+def main():
+    """Run all tests."""
+    print("Running Table Formatter Tests")
+    print("=" * 50)
+
+    tests = [
+        test_discovery_result_with_markup_in_server_strings,
+        test_discovery_result_with_missing_names,
+    ]
+
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"✗ {test.__name__} FAILED with exception: {e}")
+            return 1
+
+    print("🎉 All tests passed!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())